@@ -1,7 +1,7 @@
-import subprocess
-import os
 from pathlib import Path
 
+from translate_subtitles import translate_srt
+
 
 def main():
     # Get the current directory
@@ -21,24 +21,17 @@ def main():
     print("This may take a few minutes depending on the file size.")
 
     try:
-        subprocess.run(
-            [
-                "python",
-                current_dir / "translate_subtitles.py",
-                str(input_file),
-                str(output_file),
-                "--source",
-                "ja",
-                "--target",
-                "zh-TW",  # "zh-TW", "en", "ko", "fr", "de", "es", "pt", "it", "tr", "vi", "th", "id", "ru", "ar", "hi", "bn", "mr", "ta", "te", "ml", "ur", "fa", "ps", "sw", "am", "yo", "ha", "ig", "ceb", "jv", "su", "ms", "tl", "hmn", "my", "km", "ne", "si", "sd", "gu", "pa", "or", "as", "bn", "ma", "kn", "sa
-            ],
-            check=True,
+        translate_srt(
+            str(input_file),
+            str(output_file),
+            source_lang="ja",
+            target_lang="zh-TW",  # "zh-TW", "en", "ko", "fr", "de", "es", "pt", "it", "tr", "vi", "th", "id", "ru", "ar", "hi", "bn", "mr", "ta", "te", "ml", "ur", "fa", "ps", "sw", "am", "yo", "ha", "ig", "ceb", "jv", "su", "ms", "tl", "hmn", "my", "km", "ne", "si", "sd", "gu", "pa", "or", "as", "bn", "ma", "kn", "sa
         )
 
         print(f"\nTranslation completed successfully!")
         print(f"Translated file saved to: {output_file}")
 
-    except subprocess.CalledProcessError as e:
+    except Exception as e:
         print(f"Error during translation: {e}")
 
 
@@ -1,41 +1,378 @@
 import argparse
+import asyncio
+import atexit
+import hashlib
 import re
 import os
 import logging
-from datetime import datetime
+import mmap
+import shelve
+import sys
+import time
+from functools import lru_cache
 from pathlib import Path
+from typing import NamedTuple
 from tqdm import tqdm
 import json
-import codecs
-from openai import OpenAI
-
-# Configure logging
-log_dir = Path("logs")
-log_dir.mkdir(exist_ok=True)
-log_filename = f"translation_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+import tempfile
+import httpx
+import orjson
+from openai import AsyncOpenAI
+
+try:
+    from charset_normalizer import from_bytes as _detect_encoding
+except ImportError:  # Optional; the fallback encoding list still works
+    _detect_encoding = None
+
+try:
+    import tiktoken
+except ImportError:  # Optional; a character-count estimate is used instead
+    tiktoken = None
+
+# Configure logging; only interactive runs get a per-run log file, so
+# orchestrated/batch invocations don't litter logs/ with one file each
+handlers = [logging.StreamHandler()]
+if sys.stderr.isatty():
+    log_dir = Path("logs")
+    log_dir.mkdir(exist_ok=True)
+    log_filename = f"translation_log_{time.strftime('%Y%m%d_%H%M%S')}.log"
+    handlers.append(logging.FileHandler(log_dir / log_filename, delay=True))
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.FileHandler(log_dir / log_filename), logging.StreamHandler()],
+    handlers=handlers,
 )
 logger = logging.getLogger(__name__)
 
-# Initialize OpenAI client
-client = OpenAI()
+# Pooled HTTP/2 transport shared by all requests, so concurrent calls
+# multiplex over one TLS session instead of handshaking per call. Chat
+# completions go straight through httpx + orjson to skip the SDK's
+# Pydantic model construction on the hot path; the SDK client below is
+# kept for the Batch API file/job endpoints, which run a handful of
+# times per job.
+_http = httpx.AsyncClient(
+    base_url="https://api.openai.com/v1",
+    headers={
+        "Authorization": f"Bearer {os.environ.get('OPENAI_API_KEY', '')}",
+        "Content-Type": "application/json",
+    },
+    http2=True,
+    limits=httpx.Limits(
+        max_connections=64,
+        max_keepalive_connections=32,
+        keepalive_expiry=300.0,
+    ),
+    timeout=httpx.Timeout(60.0, connect=5.0),
+)
+
+# Initialize OpenAI client (Batch API path only); its transport keeps
+# connections alive across the long polling gaps of a batch job
+client = AsyncOpenAI(
+    http_client=httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=300.0),
+        timeout=httpx.Timeout(60.0, connect=5.0),
+    )
+)
+
+# Model used for all translation requests; -mini is ~10x cheaper with faster
+# first-token latency, which is plenty for subtitle-length translations
+MODEL = "gpt-4o-mini"
 
+# Number of subtitle blocks grouped into a single API request
+BATCH_SIZE = 20
 
-def read_srt_file(file_path):
-    """Attempt to read an SRT file with various encodings."""
-    encodings = ["utf-8", "utf-8-sig", "utf-16", "shift-jis", "euc-jp", "iso-2022-jp"]
+# Input-token ceiling per batched request; long blocks fill a batch sooner
+MAX_BATCH_INPUT_TOKENS = 3000
+
+# Token ceiling for a single text sent to the API; malformed SRTs can
+# swallow kilobytes into one cue and blow past the model context
+OVERSIZE_TOKEN_CAP = 1500
+
+# Maximum number of API requests in flight at once
+MAX_CONCURRENT_REQUESTS = 16
+
+# Retry budget for rate-limited or timed-out API calls
+MAX_RETRIES = 5
+
+# Account rate limits the scheduler stays under (conservative defaults)
+MAX_REQUESTS_PER_MINUTE = 500
+MAX_TOKENS_PER_MINUTE = 200_000
+
+# Output allowance added to each request's prompt-token estimate
+ESTIMATED_OUTPUT_TOKENS = 500
+
+# Compiled once at import; re's internal cache is small and per-call lookups add up
+_TS_RE = re.compile(r"^\d{2}:\d{2}:\d{2},\d{3}\s*-->\s*\d{2}:\d{2}:\d{2},\d{3}$")
+_NON_WORD_RE = re.compile(r"[\s\W\d]+")
+_URL_RE = re.compile(r"(?:https?://|www\.)\S+")
+_TAG_RE = re.compile(r"<[^>]+>|\{\\[^}]*\}")
+_NUMBERED_REPLY_RE = re.compile(r"^\s*(\d+)\.\s*(.*)$", re.M)
+_SENTENCE_END_RE = re.compile(r"(?<=[。．.!?！？])")
+_WS_RE = re.compile(r"\s+")
+
+if tiktoken is not None:
+    try:
+        _token_encoder = tiktoken.encoding_for_model(MODEL)
+    except KeyError:  # Older tiktoken without this model's mapping
+        _token_encoder = tiktoken.get_encoding("o200k_base")
+else:
+    _token_encoder = None
+
+# On-disk cache of previous translations, shared across runs
+_cache = shelve.open(str(Path.home() / ".srt_translate_cache"))
+atexit.register(_cache.close)
 
-    for encoding in encodings:
+# Translations currently being requested, so concurrent batches holding the
+# same text await one API call instead of issuing duplicates
+_in_flight = {}
+
+
+def _strip_tags(text):
+    """Replace formatting tags (<i>, {\\an8}, ...) with numbered placeholders.
+
+    The model neither needs to see markup nor can be trusted to return
+    it intact; placeholders keep inline positions while the literal tags
+    are held back. Returns the stripped text and the tags in order.
+    """
+    tags = []
+
+    def _replace(match):
+        tags.append(match.group(0))
+        return f"⟦{len(tags)}⟧"
+
+    return _TAG_RE.sub(_replace, text), tags
+
+
+def _restore_tags(text, tags):
+    """Re-insert tags captured by _strip_tags.
+
+    Returns None when the model dropped or mangled a placeholder, so the
+    caller can fall back to translating the raw text.
+    """
+    for i, tag in enumerate(tags, start=1):
+        placeholder = f"⟦{i}⟧"
+        if placeholder not in text:
+            return None
+        text = text.replace(placeholder, tag, 1)
+    return text
+
+
+def _needs_translation(text):
+    """Return False for cues with nothing to translate.
+
+    Music marks, bare numbers, URLs and punctuation-only lines are
+    common in SRTs and would waste an API round trip; they pass through
+    verbatim instead.
+    """
+    stripped = text.strip()
+    if not stripped:
+        return False
+    if stripped.isascii() and not any(c.isalpha() for c in stripped):
+        return False
+    if _NON_WORD_RE.fullmatch(stripped):
+        return False
+    if _URL_RE.fullmatch(stripped):
+        return False
+    return True
+
+
+class SubtitleBlock(NamedTuple):
+    number: str
+    timestamp: str
+    text: str
+
+
+@lru_cache(maxsize=8)
+def _single_system_message(source_language, target_language):
+    """Build the single-text system prompt once per language pair."""
+    return f"""
+    You are a professional translator specializing in {source_language} to {target_language} translations.
+    You must preserve all formatting and line breaks from the original text.
+    Translate only the text content; do not modify any numbers, timestamps, or special characters.
+    Your translations should sound natural and fluent in {target_language}, particularly with Taiwan usage patterns.
+    """
+
+
+@lru_cache(maxsize=8)
+def _batch_system_message(source_language, target_language):
+    """Build the numbered-batch system prompt once per language pair."""
+    return f"""
+    You are a professional translator specializing in {source_language} to {target_language} translations.
+    You will receive a numbered list of consecutive subtitle lines from one scene. Treat them as continuous dialogue: resolve pronouns and keep names, terms, and tone consistent across lines.
+    Return the same numbered list, one translation per line, with no extra commentary.
+    Preserve any \\n escape sequences exactly where they appear.
+    Translate only the text content; do not modify any numbers, timestamps, or special characters.
+    Your translations should sound natural and fluent in {target_language}, particularly with Taiwan usage patterns.
+    """
+
+
+def _cache_key(text, source_language, target_language):
+    """Build a stable cache key for a (model, language pair, text) triple.
+
+    Whitespace runs are collapsed and case is folded so trivially
+    different renditions of the same line share one cache entry.
+    """
+    normalized = _WS_RE.sub(" ", text).strip().casefold()
+    return hashlib.sha1(
+        f"{MODEL}|{source_language}|{target_language}|{normalized}".encode()
+    ).hexdigest()
+
+
+def _count_text_tokens(text):
+    """Count (or estimate) the tokens in a piece of text."""
+    if _token_encoder is not None:
+        return len(_token_encoder.encode(text))
+    return len(text)  # ~1 token/char for CJK-heavy subtitles
+
+
+def _estimate_tokens(messages):
+    """Estimate the total tokens a chat completion will consume."""
+    text = "".join(message["content"] for message in messages)
+    return _count_text_tokens(text) + ESTIMATED_OUTPUT_TOKENS
+
+
+class _RateLimiter:
+    """Dual token bucket tracking request and token budgets per minute.
+
+    A fixed semaphore either under-uses the account or storms past the
+    TPM ceiling; refilling both budgets continuously and dispatching
+    only when both allow keeps throughput at the limit without 429s.
+    """
+
+    def __init__(self, requests_per_minute, tokens_per_minute):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.available_requests = float(requests_per_minute)
+        self.available_tokens = float(tokens_per_minute)
+        self.last_refill = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self.last_refill
+        self.last_refill = now
+        self.available_requests = min(
+            self.requests_per_minute,
+            self.available_requests + elapsed * self.requests_per_minute / 60,
+        )
+        self.available_tokens = min(
+            self.tokens_per_minute,
+            self.available_tokens + elapsed * self.tokens_per_minute / 60,
+        )
+
+    async def acquire(self, tokens_needed):
+        """Block until both a request slot and `tokens_needed` are available."""
+        while True:
+            async with self.lock:
+                self._refill()
+                if self.available_requests >= 1 and self.available_tokens >= tokens_needed:
+                    self.available_requests -= 1
+                    self.available_tokens -= tokens_needed
+                    return
+                wait = max(
+                    (1 - self.available_requests) * 60 / self.requests_per_minute,
+                    (tokens_needed - self.available_tokens)
+                    * 60
+                    / self.tokens_per_minute,
+                )
+            await asyncio.sleep(min(wait, 5.0))
+
+
+_rate_limiter = _RateLimiter(MAX_REQUESTS_PER_MINUTE, MAX_TOKENS_PER_MINUTE)
+
+
+async def _chat_completion(messages):
+    """Call the chat completions API, retrying transient failures.
+
+    Posts directly over the shared httpx client with orjson payloads.
+    Rate limits, server errors and timeouts are retried with
+    exponential backoff; other errors propagate to the caller.
+    """
+    payload = orjson.dumps(
+        {"model": MODEL, "messages": messages, "temperature": 0.1}
+    )
+    delay = 2.0
+    for attempt in range(MAX_RETRIES):
+        await _rate_limiter.acquire(_estimate_tokens(messages))
         try:
-            with codecs.open(file_path, "r", encoding=encoding) as f:
-                content = f.read()
-            logger.info(f"Successfully read file with encoding: {encoding}")
-            return content
-        except UnicodeDecodeError:
-            continue
+            response = await _http.post("/chat/completions", content=payload)
+            if response.status_code == 200:
+                return orjson.loads(response.content)["choices"][0]["message"][
+                    "content"
+                ]
+            retryable = response.status_code == 429 or response.status_code >= 500
+            if not retryable or attempt == MAX_RETRIES - 1:
+                response.raise_for_status()
+            failure = f"HTTP {response.status_code}"
+        except httpx.TimeoutException as e:
+            if attempt == MAX_RETRIES - 1:
+                raise
+            failure = repr(e)
+        logger.warning(f"API call failed ({failure}); retrying in {delay:.0f}s")
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 60.0)
+
+
+def read_srt_file(file_path):
+    """Read an SRT file, detecting its encoding in a single pass.
+
+    Decoded contents are cached per (path, mtime), so re-reads of an
+    unchanged file — e.g. verify_translation right after translation —
+    are dictionary hits instead of a second decode.
+    """
+    return _read_cached(str(file_path), os.path.getmtime(file_path))
+
+
+@lru_cache(maxsize=16)
+def _read_cached(file_path, mtime):
+    """Decode a file's contents; mtime is part of the key, not used here.
+
+    The file is memory-mapped so detection and decoding read straight
+    from the page cache instead of materializing an intermediate bytes
+    copy of the whole file. Encoding detection sniffs only the first
+    64 KB; if the sniffed encoding fails on the full file, the fallback
+    encoding list takes over.
+    """
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as raw:
+            # A BOM settles the encoding outright; skip detection
+            if raw[:3] == b"\xef\xbb\xbf":
+                return str(raw, "utf-8-sig")
+            if raw[:2] in (b"\xff\xfe", b"\xfe\xff"):
+                return str(raw, "utf-16")
+
+            if _detect_encoding is not None:
+                best = _detect_encoding(bytes(raw[:65536])).best()
+                if best is not None:
+                    try:
+                        content = str(raw, best.encoding)
+                        logger.info(f"Detected file encoding: {best.encoding}")
+                        return content
+                    except UnicodeDecodeError:
+                        logger.warning(
+                            f"Sniffed encoding {best.encoding} failed on full file; "
+                            "falling back"
+                        )
+
+            # Fallback when charset-normalizer is unavailable or gave no result
+            encodings = [
+                "utf-8",
+                "utf-8-sig",
+                "utf-16",
+                "shift-jis",
+                "euc-jp",
+                "iso-2022-jp",
+            ]
+            for encoding in encodings:
+                try:
+                    content = str(raw, encoding)
+                    logger.info(f"Successfully read file with encoding: {encoding}")
+                    return content
+                except UnicodeDecodeError:
+                    continue
 
     raise ValueError(
         f"Could not decode {file_path} with any of the attempted encodings."
@@ -43,47 +380,390 @@ def read_srt_file(file_path):
 
 
 def parse_srt(content):
-    """Parse SRT content into blocks."""
-    pattern = r"(\d+)[\r\n]+(\d{2}:\d{2}:\d{2},\d{3} --> \d{2}:\d{2}:\d{2},\d{3})[\r\n]+([\s\S]*?)(?=[\r\n]+\d+[\r\n]+|$)"
-    matches = re.findall(pattern, content)
+    """Parse SRT content into blocks with a single linear pass.
+
+    SRT is a blank-line-separated record format, so splitting on "\\n\\n"
+    and peeling off the number and timestamp lines avoids the regex
+    backtracking of the old whole-file pattern.
+    """
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
 
     blocks = []
-    for match in matches:
-        subtitle_number = match[0]
-        timestamp = match[1]
-        text = match[2].strip()
-        blocks.append((subtitle_number, timestamp, text))
+    for record in content.strip().split("\n\n"):
+        lines = record.strip().split("\n", 2)
+        if len(lines) < 3:
+            continue
+        number, timestamp, text = lines
+        timestamp = timestamp.strip()
+        # Cheap positional checks reject non-timestamp lines before the regex
+        if len(timestamp) < 29 or timestamp[2] != ":" or timestamp[5] != ":":
+            continue
+        if not _TS_RE.match(timestamp):
+            continue
+        blocks.append(SubtitleBlock(number.strip(), timestamp, text.strip()))
 
     return blocks
 
 
-def translate_text(text, source_language, target_language):
-    """Translate text using OpenAI API."""
-    system_message = f"""
-    You are a professional translator specializing in {source_language} to {target_language} translations.
-    You must preserve all formatting and line breaks from the original text.
-    Translate only the text content; do not modify any numbers, timestamps, or special characters.
-    Your translations should sound natural and fluent in {target_language}, particularly with Taiwan usage patterns.
+def _split_oversized(text):
+    """Split an oversized text into sentence-aligned chunks under the cap.
+
+    The split points are zero-width (after sentence-ending punctuation),
+    so concatenating the chunks reproduces the input exactly.
     """
+    chunks, current, current_tokens = [], [], 0
+    for sentence in _SENTENCE_END_RE.split(text):
+        tokens = _count_text_tokens(sentence)
+        if current and current_tokens + tokens > OVERSIZE_TOKEN_CAP:
+            chunks.append("".join(current))
+            current, current_tokens = [], 0
+        current.append(sentence)
+        current_tokens += tokens
+    if current:
+        chunks.append("".join(current))
+    return chunks
+
+
+async def translate_text(text, source_language, target_language):
+    """Translate text using OpenAI API."""
+    if not _needs_translation(text):
+        return text
+
+    key = _cache_key(text, source_language, target_language)
+    if key in _cache:
+        return _cache[key]
+
+    # A pathological block (missing separator) could blow the model
+    # context and fail the whole call; translate it in bounded pieces
+    if _count_text_tokens(text) > OVERSIZE_TOKEN_CAP:
+        chunks = _split_oversized(text)
+        if len(chunks) > 1:
+            logger.warning(
+                f"Oversized block (~{_count_text_tokens(text)} tokens); "
+                f"translating in {len(chunks)} pieces"
+            )
+            pieces = [
+                await translate_text(chunk, source_language, target_language)
+                for chunk in chunks
+            ]
+            translated_text = "".join(pieces)
+            if translated_text != text:  # Do not cache failed pass-throughs
+                _cache[key] = translated_text
+            return translated_text
 
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {"role": "system", "content": system_message},
+        translated_text = await _chat_completion(
+            [
+                {
+                    "role": "system",
+                    "content": _single_system_message(source_language, target_language),
+                },
                 {"role": "user", "content": text},
-            ],
-            temperature=0.1,
+            ]
         )
-        translated_text = response.choices[0].message.content
+        _cache[key] = translated_text
         return translated_text
-    except Exception as e:
+    except httpx.HTTPError as e:
         logger.error(f"Translation error: {e}")
         return text  # Return original text if translation fails
 
 
+async def translate_batch(texts, source_language, target_language):
+    """Translate several subtitle texts, reusing cached translations.
+
+    Cache hits and non-translatable cues are answered locally; only the
+    remaining texts are sent to the API, so repeated lines (character
+    names, interjections) cost nothing after their first occurrence.
+    """
+    keys = [_cache_key(text, source_language, target_language) for text in texts]
+    results = [
+        text if not _needs_translation(text) else _cache.get(key)
+        for text, key in zip(texts, keys)
+    ]
+    missing = [i for i, result in enumerate(results) if result is None]
+
+    # Claim texts nobody is translating yet; duplicates (within this batch
+    # or held by a concurrent one) await the owner's future instead
+    to_request, to_await = [], []
+    for i in missing:
+        future = _in_flight.get(keys[i])
+        if future is not None:
+            to_await.append((i, future))
+        else:
+            _in_flight[keys[i]] = asyncio.get_running_loop().create_future()
+            to_request.append(i)
+
+    if to_request:
+        try:
+            # Send markup-free text; tags are restored after translation
+            stripped = [_strip_tags(texts[i]) for i in to_request]
+            translations = await _translate_batch_uncached(
+                [text for text, _ in stripped], source_language, target_language
+            )
+            for (i, (_, tags)), translated_text in zip(
+                zip(to_request, stripped), translations
+            ):
+                if tags:
+                    restored = _restore_tags(translated_text, tags)
+                    if restored is None:
+                        logger.warning(
+                            "Placeholder lost in translation; retrying with raw tags"
+                        )
+                        restored = await translate_text(
+                            texts[i], source_language, target_language
+                        )
+                    translated_text = restored
+                results[i] = translated_text
+                if translated_text != texts[i]:  # Do not cache failed pass-throughs
+                    _cache[keys[i]] = translated_text
+        finally:
+            for i in to_request:
+                future = _in_flight.pop(keys[i], None)
+                if future is not None and not future.done():
+                    future.set_result(results[i] if results[i] is not None else texts[i])
+
+    for i, future in to_await:
+        results[i] = await future
+    return results
+
+
+async def _translate_batch_uncached(texts, source_language, target_language):
+    """Translate several subtitle texts in a single API request.
+
+    Texts are sent as a numbered list and the reply is parsed back by
+    number. On a count mismatch the batch is split in half and retried,
+    falling back to one `translate_text` call per text at size one.
+    """
+    if len(texts) == 1:
+        return [await translate_text(texts[0], source_language, target_language)]
+
+    user_message = "\n".join(
+        f"{i}. {text.replace(chr(10), chr(92) + 'n')}"
+        for i, text in enumerate(texts, start=1)
+    )
+
+    try:
+        reply = await _chat_completion(
+            [
+                {
+                    "role": "system",
+                    "content": _batch_system_message(source_language, target_language),
+                },
+                {"role": "user", "content": user_message},
+            ]
+        )
+        parsed = dict(_NUMBERED_REPLY_RE.findall(reply))
+        if len(parsed) == len(texts) and all(
+            str(i) in parsed for i in range(1, len(texts) + 1)
+        ):
+            return [
+                parsed[str(i)].replace("\\n", "\n")
+                for i in range(1, len(texts) + 1)
+            ]
+        logger.warning(
+            f"Batch size {len(texts)} returned {len(parsed)} usable lines; "
+            "splitting and retrying"
+        )
+    except httpx.HTTPError as e:
+        logger.error(f"Batch translation error: {e}")
+
+    # Halve the batch and retry each half independently
+    mid = len(texts) // 2
+    return await _translate_batch_uncached(
+        texts[:mid], source_language, target_language
+    ) + await _translate_batch_uncached(texts[mid:], source_language, target_language)
+
+
+def _chunk_blocks(blocks):
+    """Group consecutive blocks into batches bounded by count and tokens.
+
+    Batches close at BATCH_SIZE blocks or MAX_BATCH_INPUT_TOKENS of
+    input, whichever comes first. Runs stay contiguous so each request
+    really is one scene's dialogue, as the batch prompt promises;
+    first-fit-decreasing packing fills batches slightly denser but
+    shuffles unrelated cues into one prompt and invites context bleed.
+    Each batch carries (original index, block) pairs so results land in
+    their file-order slots.
+    """
+    batches = []
+    current, current_tokens = [], 0
+    for i, block in enumerate(blocks):
+        tokens = _count_text_tokens(block.text)
+        if current and (
+            len(current) >= BATCH_SIZE
+            or current_tokens + tokens > MAX_BATCH_INPUT_TOKENS
+        ):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append((i, block))
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _write_block(out, subtitle_number, timestamp, text):
+    """Write a single SRT block to the output file handle."""
+    out.write(f"{subtitle_number}\n{timestamp}\n{text}\n\n")
+
+
+async def _translate_blocks(blocks, source_lang, target_lang, out):
+    """Dispatch batched translation requests concurrently, streaming output.
+
+    Batches run under a semaphore so at most MAX_CONCURRENT_REQUESTS are
+    in flight. Completed batches are written to `out` as soon as all
+    earlier batches have been written, so peak memory stays bounded by
+    the in-flight window and a crash preserves the finished prefix.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    logger.info(
+        f"Dispatching with concurrency={MAX_CONCURRENT_REQUESTS}, "
+        f"rpm={_rate_limiter.requests_per_minute}, tpm={_rate_limiter.tokens_per_minute}"
+    )
+
+    with tqdm(
+        total=len(blocks),
+        desc="Translating subtitles",
+        disable=not sys.stderr.isatty(),
+        mininterval=0.5,
+    ) as pbar:
+
+        # Batch progress updates; per-completion pbar.update() renders to
+        # the terminal and becomes measurable at high concurrency
+        progress_pending = 0
+        progress_last = time.monotonic()
+
+        async def bounded(batch):
+            nonlocal progress_pending, progress_last
+            async with semaphore:
+                translations = await translate_batch(
+                    [block.text for _, block in batch], source_lang, target_lang
+                )
+            progress_pending += len(batch)
+            now = time.monotonic()
+            if now - progress_last >= 0.1:
+                pbar.update(progress_pending)
+                progress_pending = 0
+                progress_last = now
+            return batch, translations
+
+        tasks = [bounded(batch) for batch in _chunk_blocks(blocks)]
+
+        # Land completions in a per-block slot table and flush the
+        # contiguous finished prefix in file order
+        results = [None] * len(blocks)
+        next_to_write = 0
+        last_flushed = 0
+        for task in asyncio.as_completed(tasks):
+            batch, translations = await task
+            for (index, block), translated_text in zip(batch, translations):
+                if debug_enabled:
+                    logger.debug("Original text: %s", block.text)
+                    logger.debug("Translated text: %s", translated_text)
+                results[index] = translated_text
+            while next_to_write < len(blocks) and results[next_to_write] is not None:
+                block = blocks[next_to_write]
+                _write_block(out, block.number, block.timestamp, results[next_to_write])
+                next_to_write += 1
+                # Push finished work to disk so a crash keeps the prefix
+                if next_to_write - last_flushed >= 100:
+                    out.flush()
+                    last_flushed = next_to_write
+
+        if progress_pending:
+            pbar.update(progress_pending)
+
+
+def build_batch_jsonl(blocks, source_lang, target_lang):
+    """Write one Batch API request per subtitle block to a temp JSONL file."""
+    system_message = _single_system_message(source_lang, target_lang)
+
+    fd, path = tempfile.mkstemp(suffix=".jsonl", prefix="srt_batch_")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        for i, (_, _, text) in enumerate(blocks):
+            request = {
+                "custom_id": f"blk-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": MODEL,
+                    "messages": [
+                        {"role": "system", "content": system_message},
+                        {"role": "user", "content": text},
+                    ],
+                    "temperature": 0.1,
+                },
+            }
+            f.write(json.dumps(request, ensure_ascii=False) + "\n")
+    return Path(path)
+
+
+async def _translate_blocks_batch_api(blocks, source_lang, target_lang):
+    """Translate blocks through the OpenAI Batch API.
+
+    Uploads all blocks as a single batch job, polls until it finishes,
+    and maps results back by custom_id. Blocks whose requests failed
+    keep their original text, mirroring the synchronous error handling.
+    """
+    jsonl_path = build_batch_jsonl(blocks, source_lang, target_lang)
+    try:
+        with open(jsonl_path, "rb") as f:
+            batch_file = await client.files.create(file=f, purpose="batch")
+        batch = await client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        logger.info(f"Submitted batch {batch.id} with {len(blocks)} requests")
+
+        # Poll with a growing interval; batch jobs routinely take minutes
+        poll_interval = 10
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(poll_interval)
+            poll_interval = min(poll_interval * 2, 60)
+            batch = await client.batches.retrieve(batch.id)
+            logger.info(f"Batch {batch.id} status: {batch.status}")
+
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+
+        output = await client.files.content(batch.output_file_id)
+        results = {}
+        for line in output.text.splitlines():
+            data = json.loads(line)
+            response = data.get("response")
+            if response and response.get("status_code") == 200:
+                results[data["custom_id"]] = response["body"]["choices"][0][
+                    "message"
+                ]["content"]
+
+        if batch.error_file_id:
+            errors = await client.files.content(batch.error_file_id)
+            for line in errors.text.splitlines():
+                data = json.loads(line)
+                logger.error(
+                    f"Batch request {data.get('custom_id')} failed: {data.get('error')}"
+                )
+    finally:
+        jsonl_path.unlink(missing_ok=True)
+
+    translated_blocks = []
+    for i, (subtitle_number, timestamp, text) in enumerate(blocks):
+        translated_blocks.append(
+            (subtitle_number, timestamp, results.get(f"blk-{i}", text))
+        )
+    return translated_blocks
+
+
 def translate_srt(
-    input_file, output_file, source_lang="ja", target_lang="zh-TW", debug=False
+    input_file,
+    output_file,
+    source_lang="ja",
+    target_lang="zh-TW",
+    debug=False,
+    use_batch_api=False,
 ):
     """Translate an SRT file from source language to target language."""
     if debug:
@@ -98,33 +778,27 @@ def translate_srt(
     blocks = parse_srt(content)
     logger.info(f"Found {len(blocks)} subtitle blocks")
 
-    # Translate blocks
-    translated_blocks = []
-    for subtitle_number, timestamp, text in tqdm(blocks, desc="Translating subtitles"):
-        logger.debug(f"Translating block {subtitle_number}")
-        logger.debug(f"Original text: {text}")
-
-        translated_text = translate_text(text, source_lang, target_lang)
-        logger.debug(f"Translated text: {translated_text}")
-
-        translated_blocks.append((subtitle_number, timestamp, translated_text))
-
-    # Write translated content to output file
+    # Translate and stream blocks to the output file as they complete
     logger.info(f"Writing translated content to: {output_file}")
-    with open(output_file, "w", encoding="utf-8") as f:
-        for subtitle_number, timestamp, text in translated_blocks:
-            f.write(f"{subtitle_number}\n")
-            f.write(f"{timestamp}\n")
-            f.write(f"{text}\n\n")
+    with open(output_file, "w", encoding="utf-8", buffering=1 << 20) as out:
+        if use_batch_api:
+            translated_blocks = asyncio.run(
+                _translate_blocks_batch_api(blocks, source_lang, target_lang)
+            )
+            for subtitle_number, timestamp, text in translated_blocks:
+                _write_block(out, subtitle_number, timestamp, text)
+        else:
+            asyncio.run(_translate_blocks(blocks, source_lang, target_lang, out))
 
     logger.info("Translation completed")
 
 
-def verify_translation(input_file, output_file):
+async def verify_translation(input_file, output_file):
     """Verify translation by comparing sample lines from both files."""
-    input_content = read_srt_file(input_file)
-    output_content = read_srt_file(output_file)
-
+    input_content, output_content = await asyncio.gather(
+        asyncio.to_thread(read_srt_file, input_file),
+        asyncio.to_thread(read_srt_file, output_file),
+    )
     input_blocks = parse_srt(input_content)
     output_blocks = parse_srt(output_content)
 
@@ -133,26 +807,26 @@ def verify_translation(input_file, output_file):
             f"Block count mismatch: Input has {len(input_blocks)} blocks, Output has {len(output_blocks)} blocks"
         )
 
-    sample_size = min(5, len(input_blocks))
-    sample_indices = [
-        0,
-        len(input_blocks) // 4,
-        len(input_blocks) // 2,
-        3 * len(input_blocks) // 4,
-        len(input_blocks) - 1,
-    ]
-    sample_indices = [
-        i for i in sample_indices if i < len(input_blocks) and i < len(output_blocks)
-    ]
+    n = min(len(input_blocks), len(output_blocks))
+    if n == 0:
+        return
+
+    # Evenly spaced, de-duplicated sample indices spanning the file
+    sample_size = min(5, n)
+    step = (n - 1) / (sample_size - 1) if sample_size > 1 else 0
+    sample_indices = dict.fromkeys(round(i * step) for i in range(sample_size))
 
-    print("\nVerification Samples:")
-    for idx in sample_indices[:sample_size]:
-        print(f"\nBlock {input_blocks[idx][0]}:")
-        print(f"Original: {input_blocks[idx][2]}")
-        print(f"Translated: {output_blocks[idx][2]}")
+    lines = ["\nVerification Samples:"]
+    for idx in sample_indices:
+        lines.append(f"\nBlock {input_blocks[idx][0]}:")
+        lines.append(f"Original: {input_blocks[idx][2]}")
+        lines.append(f"Translated: {output_blocks[idx][2]}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
+    global MAX_CONCURRENT_REQUESTS, _rate_limiter
+
     parser = argparse.ArgumentParser(
         description="Translate SRT subtitle files using OpenAI API"
     )
@@ -174,15 +848,51 @@ def main():
     parser.add_argument(
         "--target", default="zh-TW", help="Target language code (default: zh-TW)"
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Use the OpenAI Batch API (cheaper, up to 24h turnaround)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=MAX_CONCURRENT_REQUESTS,
+        help=f"Maximum API requests in flight (default: {MAX_CONCURRENT_REQUESTS})",
+    )
+    parser.add_argument(
+        "--rpm",
+        type=int,
+        default=MAX_REQUESTS_PER_MINUTE,
+        help=f"Requests-per-minute budget (default: {MAX_REQUESTS_PER_MINUTE})",
+    )
+    parser.add_argument(
+        "--tpm",
+        type=int,
+        default=MAX_TOKENS_PER_MINUTE,
+        help=f"Tokens-per-minute budget (default: {MAX_TOKENS_PER_MINUTE})",
+    )
 
     args = parser.parse_args()
 
+    # Retune the scheduler to the account's actual limits before translating
+    MAX_CONCURRENT_REQUESTS = args.concurrency
+    if (args.rpm, args.tpm) != (
+        _rate_limiter.requests_per_minute,
+        _rate_limiter.tokens_per_minute,
+    ):
+        _rate_limiter = _RateLimiter(args.rpm, args.tpm)
+
     translate_srt(
-        args.input_file, args.output_file, args.source, args.target, args.debug
+        args.input_file,
+        args.output_file,
+        args.source,
+        args.target,
+        args.debug,
+        use_batch_api=args.batch,
     )
 
     if args.verify:
-        verify_translation(args.input_file, args.output_file)
+        asyncio.run(verify_translation(args.input_file, args.output_file))
 
 
 if __name__ == "__main__":